@@ -1 +0,0 @@
-from edbo_tools import *
\ No newline at end of file
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Maximum number of offers fetched concurrently
+MAX_WORKERS = 32
+
+# Number of pages of a single offer requested at once once the first page is full
+PREFETCH_PAGES = 4
+
+# Number of per-host connection pools kept by the adapter; requests only ever go to the EDBO hosts
+POOL_CONNECTIONS = 32
+
+# Default number of kept-alive connections per host; covers every worker prefetching pages at once
+POOL_MAXSIZE = MAX_WORKERS * PREFETCH_PAGES
+
+# Retry policy for transient failures; the EDBO endpoints only read data, so POSTs are safe to retry
+RETRY_POLICY = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({'GET', 'POST'}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Headers sent with every request made through the shared session
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0',
+}
+
+_session = None
+_session_lock = threading.Lock()
+_pool_maxsize = POOL_MAXSIZE
+
+
+def get_session() -> requests.Session:
+    """
+    Returns the shared HTTP session, creating it on first use.
+
+    The session keeps connections to the EDBO host alive between requests, so
+    only the first request to each host pays for the TCP and TLS handshakes.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _configure_session(requests.Session())
+    return _session
+
+
+def enable_cache(cache_name: str = '.edbo_cache', expire_after: int = 3600) -> requests.Session:
+    """
+    Replaces the shared HTTP session with one that caches responses on disk.
+
+    Both offer pages and paginated offer requests are cached (the POST body is part
+    of the cache key), so repeated runs within the expiry window skip the network.
+    Requires the optional requests-cache dependency (the `cache` extra).
+
+    Args:
+        cache_name (str): Path of the SQLite cache database, without the extension.
+        expire_after (int): Number of seconds a cached response stays valid.
+
+    Returns:
+        requests_cache.CachedSession: The new shared session.
+
+    Raises:
+        ImportError: If requests-cache is not installed.
+    """
+    global _session
+    try:
+        from requests_cache import CachedSession
+    except ImportError as e:
+        raise ImportError("Response caching requires requests-cache: pip install 'EdboTools[cache]'") from e
+
+    session = _configure_session(CachedSession(
+        cache_name,
+        backend='sqlite',
+        expire_after=expire_after,
+        allowable_methods=('GET', 'POST')
+    ))
+    with _session_lock:
+        _session = session
+    return session
+
+
+def reserve_connections(max_workers: int) -> None:
+    """
+    Grows the shared session's connection pool to fit the given number of concurrent workers.
+
+    Each worker may have PREFETCH_PAGES requests in flight. Connections beyond the pool size
+    are closed after every request instead of being kept alive, so the pool is sized to match.
+
+    Args:
+        max_workers (int): Number of offers fetched concurrently.
+    """
+    global _pool_maxsize
+    pool_maxsize = max_workers * PREFETCH_PAGES
+    if pool_maxsize <= _pool_maxsize:
+        return
+    session = get_session()
+    with _session_lock:
+        _pool_maxsize = pool_maxsize
+        _mount_adapter(session)
+
+
+def _configure_session(session: requests.Session) -> requests.Session:
+    """
+    Applies the connection pool, retry policy and default headers to a session.
+
+    Args:
+        session (requests.Session): The session to configure.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    _mount_adapter(session)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+def _mount_adapter(session: requests.Session) -> None:
+    """
+    Mounts an HTTPS adapter with the current pool size and the retry policy on a session,
+    closing the adapter it replaces.
+
+    Args:
+        session (requests.Session): The session to mount the adapter on.
+    """
+    previous = session.adapters.get('https://')
+    session.mount('https://', HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=_pool_maxsize,
+        max_retries=RETRY_POLICY
+    ))
+    if previous is not None:
+        # Release the connections pooled by the replaced adapter
+        previous.close()
@@ -0,0 +1,6 @@
+import sys
+
+from edbo_tools.cli.fetch_offers_results import main
+
+if __name__ == "__main__":
+    sys.exit(main())
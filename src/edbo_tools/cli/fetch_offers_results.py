@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import argparse
+import sys
+
+# Default for --workers; mirrors edbo_tools.utils.MAX_WORKERS, which is not imported here
+# so that parsing arguments does not load the HTTP stack
+DEFAULT_WORKERS = 32
+
+
+def positive_int(value: str) -> int:
+    """
+    Argument type accepting only integers greater than zero.
+
+    Args:
+        value (str): The raw command-line value.
+
+    Returns:
+        int: The parsed value.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
+def main() -> int:
+    """
+    Command-line interface for fetching and saving offer results.
+
+    Returns:
+        int: The process exit status; non-zero if fetching or saving the results failed.
+    """
+    parser = argparse.ArgumentParser(prog="fetch-results", description="Fetch and save NMT results for a university.")
+    parser.add_argument("--university", type=int, required=True, help="University code (integer).")
+    parser.add_argument("--year", type=int, required=True, help="Year of results (integer).")
+    parser.add_argument("--output", type=str, required=True, help="Path to the output CSV file.")
+    parser.add_argument("--workers", type=positive_int, default=DEFAULT_WORKERS,
+                        help=f"Number of offers fetched concurrently (default: {DEFAULT_WORKERS}).")
+    parser.add_argument("--no-cache", action="store_true", help="Discard cached responses and fetch fresh data.")
+
+    args = parser.parse_args()
+
+    # Imported only after parsing succeeds, so --help and usage errors skip loading the HTTP stack
+    import requests
+    from edbo_tools._http import enable_cache
+    from edbo_tools.utils import fetch_university_offers_ids_list, iter_offers_results, save_to_csv
+
+    # Cache responses on disk so repeated runs do not re-download unchanged pages
+    try:
+        session = enable_cache()
+    except ImportError:
+        session = None
+    if session is not None and args.no_cache:
+        session.cache.clear()
+
+    try:
+        # Fetch the list of offer IDs for the given university and year
+        offer_ids = fetch_university_offers_ids_list(args.university, args.year)
+
+        if not offer_ids:
+            print("No offers found for the specified university and year.")
+            return 0
+
+        # Fetch and process the results for the retrieved offer IDs
+        rows, columns = iter_offers_results(offer_ids, args.year, args.workers)
+
+        # Stream the processed results to a CSV file as they arrive
+        saved = save_to_csv(rows, columns, args.output)
+    except (requests.RequestException, ValueError) as e:
+        # ValueError covers invalid JSON responses from either JSON parser
+        print(f"Error: failed to fetch results: {e}", file=sys.stderr)
+        return 1
+
+    if not saved:
+        return 1
+    print(f"Results saved to {args.output}")
+    return 0
@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import csv
+import os
+import requests
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+# orjson is an optional dependency (the `fast` extra); the standard library parser is used without it
+try:
+    from orjson import JSONDecodeError, loads as json_loads
+except ImportError:
+    from json import JSONDecodeError, loads as json_loads
+
+from edbo_tools._http import MAX_WORKERS, PREFETCH_PAGES, get_session, reserve_connections
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Mapping of PRSID codes to their corresponding statuses
+PRSID_MAP = {
+    "1": "заява надійшла з сайту",
+    "2": "затримано",
+    "3": "скасовано вступником",
+    "4": "скасовано (втрата пріор.)",
+    "5": "зареєстровано",
+    "6": "допущено",
+    "7": "відмова",
+    "8": "скасовано ЗО",
+    "9": "рекомендовано (бюджет)",
+    "10": "відхилено (бюджет)",
+    "11": "допущено (контракт, за ріш. ПК)",
+    "12": "рекомендовано (контракт)",
+    "13": "відхилено (контракт)",
+    "14": "до наказу",
+    "15": "відраховано",
+    "16": "деактивовано (зарах. на бюджет)"
+}
+
+# Mapping of PTID codes to their corresponding funding types
+PTID_MAP = {
+    "1": "бюджет",
+    "2": "контракт"
+}
+
+# Pagination limit for API requests
+PAGINATION_LIMIT = 100
+
+# Pattern locating the start of the `let offer = {...}` JSON literal on an offer page
+OFFER_DATA_START_PATTERN = re.compile(r'let\s+offer\s*=\s*(?=\{)')
+
+# Pattern matching the tokens that matter when scanning a JSON literal: braces and whole strings
+JSON_TOKEN_PATTERN = re.compile(r'[{}]|"(?:[^"\\]|\\.)*"')
+
+# Subject mappings of already fetched offers, keyed by (year, offer ID)
+_offer_subjects_cache = {}
+
+
+def fetch_offers_results_table(offer_ids: list[int], year: int,
+                               max_workers: int = MAX_WORKERS) -> tuple[list[dict], list[str]]:
+    """
+    Fetches and processes offer results to generate a table with columns: prid, pa, status, and subjects.
+
+    Offer pages are fetched concurrently, so the total time is bound by the slowest
+    requests rather than by the sum of all round trips.
+
+    Args:
+        offer_ids (list[int]): List of offer IDs to process.
+        year (int): The specific year for which the data is being fetched.
+        max_workers (int): Maximum number of offers fetched concurrently.
+
+    Returns:
+        tuple: A tuple containing:
+            - filtered (list[dict]): List of dictionaries representing rows of the table.
+            - columns (list[str]): List of column names for the table.
+    """
+    rows, columns = iter_offers_results(offer_ids, year, max_workers)
+    return list(rows), columns
+
+
+def iter_offers_results(offer_ids: list[int], year: int,
+                        max_workers: int = MAX_WORKERS) -> tuple[Iterator[dict], list[str]]:
+    """
+    Fetches offer results like fetch_offers_results_table, but yields the rows lazily.
+
+    The columns are known once the subject pages are fetched, so the rows can be written
+    out as each offer's applications arrive instead of being collected in memory first.
+
+    Args:
+        offer_ids (list[int]): List of offer IDs to process.
+        year (int): The specific year for which the data is being fetched.
+        max_workers (int): Maximum number of offers fetched concurrently.
+
+    Returns:
+        tuple: A tuple containing:
+            - rows (Iterator[dict]): Iterator over dictionaries representing rows of the table.
+            - columns (list[str]): List of column names for the table.
+    """
+    all_subject_names = set()
+    reserve_connections(max_workers)
+
+    # Retrieve subject mappings for each offer
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        offers_subjects = dict(zip(
+            offer_ids,
+            executor.map(lambda offer_id: fetch_offer_subjects_map(offer_id, year), offer_ids)
+        ))
+    for subjects in offers_subjects.values():
+        all_subject_names.update(filter(None, subjects.values()))
+
+    # Sort subject names and define table columns
+    columns = ['prid', 'pa', 'status'] + sorted(all_subject_names)
+
+    return _iter_offers_rows(offer_ids, year, offers_subjects, columns, max_workers), columns
+
+
+def _iter_offers_rows(offer_ids: list[int], year: int, offers_subjects: dict, columns: list[str],
+                      max_workers: int) -> Iterator[dict]:
+    """
+    Fetches the applications of each offer and yields them as table rows, in offer order.
+
+    Args:
+        offer_ids (list[int]): List of offer IDs to process.
+        year (int): The specific year for which the data is being fetched.
+        offers_subjects (dict): Subject ID to subject name mapping for each offer.
+        columns (list[str]): List of column names for the table.
+        max_workers (int): Maximum number of offers fetched concurrently.
+
+    Yields:
+        dict: A dictionary representing a row of the table.
+    """
+    # Every row starts as a copy of an empty template instead of being rebuilt column by column
+    empty_row = dict.fromkeys(columns, '')
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        offers_requests = executor.map(lambda offer_id: fetch_offer_requests(offer_id, year), offer_ids)
+        for offer_id, requests_list in zip(offer_ids, offers_requests):
+            # Also key numeric subject IDs as integers, so raw IDs from the records need no str() per score
+            subjects = offers_subjects.get(offer_id, {})
+            id_to_subject = {**subjects, **{int(k): v for k, v in subjects.items() if k.isdigit()}}
+            for req in requests_list:
+                row = empty_row.copy()
+                row['prid'] = req.get('prid', '')
+                row['pa'] = req.get('pa', '')
+                prsid = str(req.get('prsid', ''))
+                ptid = str(req.get('ptid', ''))
+                status = PRSID_MAP.get(prsid, prsid)
+                if prsid == "14":
+                    status += f" ({PTID_MAP.get(ptid, ptid)})"
+                row['status'] = status
+                for rss in req.get('rss', []):
+                    subj_name = id_to_subject.get(rss.get('id'))
+                    if subj_name:
+                        score = rss.get('f')
+                        row[subj_name] = score[:3] if isinstance(score, str) else ''
+                yield row
+    finally:
+        # Drop offers still queued instead of waiting for them when a fetch fails or iteration stops early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def fetch_offer_subjects_map(offer_id: int, year: int) -> dict:
+    """
+    Retrieves the mapping of subject IDs to subject names for a single offer.
+
+    Successfully parsed maps are kept for the lifetime of the process, so each offer page
+    is downloaded at most once per year. Failed attempts are not cached and are retried.
+
+    Args:
+        offer_id (int): The offer ID to fetch subjects for.
+        year (int): The specific year for which the data is being fetched.
+
+    Returns:
+        dict: A dictionary mapping subject IDs (as strings) to subject names, or an empty
+            dictionary if the request fails or the page is invalid. The dictionary is shared
+            between calls and must not be modified.
+    """
+    key = (year, str(offer_id))
+    subjects = _offer_subjects_cache.get(key)
+    if subjects is None:
+        subjects = _download_offer_subjects_map(offer_id, year)
+        if subjects is None:
+            return {}
+        _offer_subjects_cache[key] = subjects
+    return subjects
+
+
+def _download_offer_subjects_map(offer_id: int, year: int) -> dict | None:
+    """
+    Downloads and parses the subject mapping of a single offer, bypassing the in-process cache.
+
+    Args:
+        offer_id (int): The offer ID to fetch subjects for.
+        year (int): The specific year for which the data is being fetched.
+
+    Returns:
+        dict | None: The subject mapping, or None if the request fails or the page is invalid.
+    """
+    try:
+        response = get_session().get(f'{build_base_url(year)}/offer/{offer_id}/')
+        if response.status_code != 200:
+            return None
+        # Offer pages are always UTF-8; decoding directly skips requests' charset detection
+        offer_json = extract_offer_json(response.content.decode('utf-8', errors='replace'))
+        if offer_json is None:
+            return None
+        offer_data = json_loads(offer_json.replace('&ndash;', '-'))
+        return {str(k): v.get('sn', '') for k, v in offer_data.get('os', {}).items()}
+    except (requests.RequestException, JSONDecodeError):
+        return None
+
+
+def extract_offer_json(text: str) -> str | None:
+    """
+    Extracts the `let offer = {...}` JSON literal from an offer page.
+
+    The literal is delimited by matching braces in a single forward scan, skipping
+    over string contents, so the cost stays linear in the size of the page.
+
+    Args:
+        text (str): The HTML of the offer page.
+
+    Returns:
+        str | None: The JSON object literal, or None if it is missing or unterminated.
+    """
+    match = OFFER_DATA_START_PATTERN.search(text)
+    if not match:
+        return None
+    start = match.end()
+    depth = 0
+    for token in JSON_TOKEN_PATTERN.finditer(text, start):
+        brace = token.group()
+        if brace == '{':
+            depth += 1
+        elif brace == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:token.end()]
+    return None
+
+
+def fetch_offer_requests(offer_id: int, year: int) -> list[dict]:
+    """
+    Retrieves all applications submitted to a single offer, following pagination.
+
+    The first page is fetched on its own. If it is full, the following pages are requested
+    PREFETCH_PAGES at a time, and everything after the first short page is discarded.
+
+    Args:
+        offer_id (int): The offer ID to fetch applications for.
+        year (int): The specific year for which the data is being fetched.
+
+    Returns:
+        list[dict]: A list of raw application records as returned by the API.
+    """
+    requests_list = fetch_offer_requests_page(offer_id, year, 0)
+    if requests_list is None:
+        return []
+    if len(requests_list) < PAGINATION_LIMIT:
+        return requests_list
+
+    last = PAGINATION_LIMIT
+    with ThreadPoolExecutor(max_workers=PREFETCH_PAGES) as executor:
+        while True:
+            offsets = range(last, last + PREFETCH_PAGES * PAGINATION_LIMIT, PAGINATION_LIMIT)
+            pages = executor.map(lambda offset: fetch_offer_requests_page(offer_id, year, offset), offsets)
+            for page in pages:
+                if page is None:
+                    return requests_list
+                requests_list.extend(page)
+                if len(page) < PAGINATION_LIMIT:
+                    return requests_list
+            last += PREFETCH_PAGES * PAGINATION_LIMIT
+
+
+def fetch_offer_requests_page(offer_id: int, year: int, last: int) -> list[dict] | None:
+    """
+    Retrieves a single page of applications submitted to an offer.
+
+    Args:
+        offer_id (int): The offer ID to fetch applications for.
+        year (int): The specific year for which the data is being fetched.
+        last (int): The number of applications to skip.
+
+    Returns:
+        list[dict] | None: A list of raw application records, or None if the request fails
+            or the response holds no applications.
+    """
+    response = get_session().post(
+        f'{build_base_url(year)}/offer-requests/',
+        data={'id': offer_id, 'last': str(last)},
+        headers=generate_headers(year)
+    )
+    if response.status_code != 200:
+        return None
+    data = json_loads(response.content)
+    if not data or 'requests' not in data:
+        return None
+    return data['requests']
+
+
+@lru_cache(maxsize=8)
+def generate_headers(year: int) -> dict:
+    """
+    Generates the request-specific HTTP headers. Static headers are set once on the shared session.
+
+    Content-Length is left to requests, which computes it from the encoded form body.
+    The result is cached per year and shared between calls, so it must not be modified.
+
+    Args:
+        year (int): The year to construct the base URL for.
+
+    Returns:
+        dict: A dictionary containing the HTTP headers.
+    """
+    return {
+        'Referer': build_base_url(year) + '/',
+        'Accept': 'application/json',
+        'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+    }
+
+
+def fetch_university_offers_ids_list(university_code: int, year: int) -> list:
+    """
+    Retrieves a list of offer IDs for the university.
+
+    Args:
+        university_code (int): The code of the university to fetch offers for.
+        year (int): The specific year for which the data is being fetched.
+
+    Returns:
+        list: A list of offer IDs, or an empty list if the request fails or the response is invalid.
+    """
+    offers_ids_url = f'{build_base_url(year)}/offers-universities/'
+    response = get_session().post(
+        offers_ids_url,
+        data={'university': str(university_code), 'qualification': '1', 'education_base': '40'},
+        headers=generate_headers(year)
+    )
+    if response.status_code == 200 and response.content:
+        try:
+            data = json_loads(response.content)
+            return data.get('universities', [{}])[0].get('ids', '').split(',')
+        except ValueError:
+            # Covers JSONDecodeError from either parser and UnicodeDecodeError from the stdlib one
+            print("Warning: Received invalid JSON response.")
+            return []
+    return []
+
+
+def save_to_csv(data, columns, filepath):
+    """
+    Saves the provided data to a CSV file.
+
+    Rows are written as they are consumed, so an iterator such as the one returned by
+    iter_offers_results is streamed to disk without being collected first. They are written
+    to a temporary file next to filepath, which replaces filepath only once every row has
+    been written, so a failure never leaves a truncated file or clobbers an existing one.
+    File and CSV errors are reported and make the function return False; errors raised while
+    producing the rows, such as network errors from a failing fetch, are re-raised.
+
+    Args:
+        data (Iterable[dict]): The data to be written to the CSV file.
+        columns (list[str]): The column names for the CSV file.
+        filepath (str): The path to the file where the data will be saved.
+
+    Returns:
+        bool: True if the data was saved, False if writing the file failed.
+    """
+    temp_path = f'{filepath}.{os.getpid()}.tmp'
+    try:
+        with open(temp_path, mode='w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(data)
+        os.replace(temp_path, filepath)
+    except requests.RequestException:
+        # RequestException subclasses OSError, but it is a fetch failure, not a write failure
+        raise
+    except (OSError, csv.Error) as e:
+        print(f"An error occurred while saving to CSV: {e}")
+        return False
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    print(f"Data successfully saved to {filepath}")
+    return True
+
+
+def fetch_offer_results(offer_id: int, year: int) -> tuple[list[dict], list[str]]:
+    """
+    Fetches and processes results for a single offer ID.
+
+    Args:
+        offer_id (int): The offer ID to process.
+        year (int): The specific year for which the data is being fetched.
+
+    Returns:
+        tuple: A tuple containing:
+            - filtered (list[dict]): List of dictionaries representing rows of the table.
+            - columns (list[str]): List of column names for the table.
+    """
+    return fetch_offers_results_table([offer_id], year)
+
+
+@lru_cache(maxsize=8)
+def build_base_url(year: int) -> str:
+    """
+    Builds the base URL for the given year.
+
+    Args:
+        year (int): The year to construct the base URL for.
+
+    Returns:
+        str: The constructed base URL.
+    """
+    return f"https://vstup{year}.edbo.gov.ua/"